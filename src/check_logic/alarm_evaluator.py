@@ -1,19 +1,23 @@
+import hashlib
 import json
 import logging
 import os
+import time
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional, Union
 
 import boto3
 
 from botocore.paginate import Paginator
 from botocore.client import BaseClient
+from botocore.config import Config
 
 
 logger = logging.getLogger()
-logging.basicConfig(level=logging.INFO)
 
 TABLE_NAME = os.environ.get("DYNAMODB_TABLE", "alarm-evaluator")
 DESCRIPTION_TABLE_NAME = os.environ.get(
@@ -23,24 +27,257 @@ AWS_REGION = os.environ.get("AWS_REGION")
 # Seperate region to use a Region where Bedrock has access to Claude 3 Sonnet
 AWS_BEDROCK_REGION = os.environ.get("AWS_BEDROCK_REGION", "us-west-2")
 
-cw_client = boto3.client("cloudwatch", region_name=AWS_REGION)
-bedrock_runtime = boto3.client(
-    service_name="bedrock-runtime", region_name=AWS_BEDROCK_REGION
+# Regions to scan for alarms, as a comma separated list. Defaults to the
+# region the task runs in.
+ALARM_REGIONS = [
+    region.strip()
+    for region in os.environ.get("ALARM_REGIONS", "").split(",")
+    if region.strip()
+] or [AWS_REGION]
+
+# Only analyse alarms whose names start with this prefix
+ALARM_NAME_PREFIX = os.environ.get("ALARM_NAME_PREFIX") or None
+
+# Number of describe_alarm_history requests in flight at once
+HISTORY_CONCURRENCY = int(os.environ.get("HISTORY_CONCURRENCY", "16"))
+
+# Number of Bedrock requests in flight at once, raise it if the account's
+# Bedrock quota allows for more
+BEDROCK_CONCURRENCY = int(os.environ.get("BEDROCK_CONCURRENCY", "8"))
+
+# Most alarms assessed per Bedrock request. Batched responses are capped at
+# 4096 output tokens, and a larger batch truncates the JSON array.
+MAX_DESCRIPTION_BATCH_SIZE = 20
+
+# Number of alarms assessed per Bedrock request. 1 sends each alarm on its
+# own, larger values share one prompt (and its latency) between alarms.
+DESCRIPTION_BATCH_SIZE = min(
+    int(os.environ.get("DESCRIPTION_BATCH_SIZE", "1")),
+    MAX_DESCRIPTION_BATCH_SIZE,
 )
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
-basic_alarm_table = dynamodb.Table(TABLE_NAME)
-alarm_description_table = dynamodb.Table(DESCRIPTION_TABLE_NAME)
+
+# Reuse the stored assessment of alarms whose prompt fields are unchanged
+# since the last run instead of asking Bedrock again
+DESCRIPTION_CACHE = (
+    os.environ.get("DESCRIPTION_CACHE", "true").lower() == "true"
+)
+
+# Only ask Bedrock about alarms that have no description at all, rather
+# than assessing the quality of every description
+DESCRIBE_MISSING_ONLY = (
+    os.environ.get("DESCRIBE_MISSING_ONLY", "false").lower() == "true"
+)
+
+# BatchGetItem requests made for each chunk of cached descriptions before
+# falling back to calling Bedrock for every alarm
+CACHE_READ_ATTEMPTS = 5
+
+MODEL_ID = "anthropic.claude-3-sonnet-20240229-v1:0"
+# This model is better but we are rate limited internally
+# MODEL_ID = "anthropic.claude-3-5-sonnet-20241022-v2:0"
+# MODEL_ID = "anthropic.claude-3-5-haiku-20241022-v1:0"
+
+DESCRIPTION_GUIDANCE = """
+    You are a helpful assistant that analyzes CloudWatch Alarm data.
+    You assess whether alarm descriptions are meaningful and representative of
+    the alarm.
+    Alarm descriptions should be descriptive, containing information on what
+    metric triggers the alarm as well as the threshold and
+    what actions are triggered.
+    Additionally, it is good practice to link a playbook (only 1 link should
+    be included).
+    """
+
+DESCRIPTION_SYSTEM_PROMPT = DESCRIPTION_GUIDANCE + """
+    You will be presented an Alarm description (in <desc>) tags
+    and a JSON object that describes the alarm (in <alarm> tags).
+    If the alarm description is not in the object, is None or is a blank
+    string, suggest a new description
+
+    After assessing the alarm, provide a suggested new alarm
+    description that incorporates your feedback.
+
+    When returning your output, be succinct in your assessment,
+    skip any preamble and wrap it into a JSON object like the following:
+    {
+        "assessment": <your assessment>,
+        "suggested_description": <your suggested description>
+    }
+    """
+
+DESCRIPTION_BATCH_SYSTEM_PROMPT = DESCRIPTION_GUIDANCE + """
+    You will be presented several alarms, each in <alarm> tags with an id
+    attribute. Each contains an Alarm description (in <desc> tags) and a
+    JSON object that describes the alarm (in <config> tags).
+    If the alarm description is not in the object, is None or is a blank
+    string, suggest a new description
+
+    After assessing each alarm, provide a suggested new alarm
+    description that incorporates your feedback.
+
+    When returning your output, be succinct in your assessments,
+    skip any preamble and wrap them into a JSON array with one object per
+    alarm like the following:
+    [
+        {
+            "id": <the alarm id>,
+            "assessment": <your assessment>,
+            "suggested_description": <your suggested description>
+        }
+    ]
+    """
+
+# Alarm fields sent to Bedrock when assessing a description. State, reason
+# and timestamp fields say nothing about what the alarm monitors and only
+# add input tokens to every request.
+DESCRIPTION_PROMPT_FIELDS = (
+    "AlarmName",
+    "AlarmDescription",
+    "ActionsEnabled",
+    "OKActions",
+    "AlarmActions",
+    "InsufficientDataActions",
+    "MetricName",
+    "Namespace",
+    "Statistic",
+    "ExtendedStatistic",
+    "Dimensions",
+    "Period",
+    "Unit",
+    "EvaluationPeriods",
+    "DatapointsToAlarm",
+    "Threshold",
+    "ComparisonOperator",
+    "TreatMissingData",
+    "Metrics",
+    "ThresholdMetricId",
+)
+
+# History check thresholds, built once rather than on every history item
+RECURRING_ALARM_WINDOW = timedelta(hours=24)
+RECURRING_IN_12_HOURS_WINDOW = timedelta(hours=12)
+LONG_LIVED_ALARM_DURATION = timedelta(hours=48)
+SHORT_ALARM_DURATION = timedelta(minutes=2)
+ZERO_DURATION = timedelta(0)
+
+# Alarm fields stored against each basic check, the alarm names are all the
+# report widget reads and the ARN identifies the alarm across regions
+REPORT_ALARM_FIELDS = ("AlarmName", "AlarmArn")
+
+# Shared by every client so that concurrent requests reuse pooled
+# connections and throttled calls back off instead of failing. The pool is
+# kept at least as large as the number of threads sharing a client.
+BOTO_CONFIG = Config(
+    max_pool_connections=max(64, HISTORY_CONCURRENCY, BEDROCK_CONCURRENCY),
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+)
+
+
+# Clients are created on first use, so that importing the module or a run
+# that never reaches Bedrock or DynamoDB does not pay for them
+def get_cw_client(region: Optional[str] = None) -> BaseClient:
+    return _get_cw_client(region or AWS_REGION)
+
+
+@cache
+def _get_cw_client(region: Optional[str]) -> BaseClient:
+    return boto3.client("cloudwatch", region_name=region, config=BOTO_CONFIG)
+
+
+@cache
+def get_bedrock_runtime() -> BaseClient:
+    return boto3.client(
+        service_name="bedrock-runtime",
+        region_name=AWS_BEDROCK_REGION,
+        config=BOTO_CONFIG,
+    )
+
+
+@cache
+def get_dynamodb():
+    return boto3.resource(
+        "dynamodb", region_name=AWS_REGION, config=BOTO_CONFIG
+    )
+
+
+def get_basic_alarm_table():
+    return get_dynamodb().Table(TABLE_NAME)
+
+
+def get_alarm_description_table():
+    return get_dynamodb().Table(DESCRIPTION_TABLE_NAME)
+
+
+def iter_cw_alarms(
+    client: BaseClient,
+    alarm_types: tuple[str, ...] = ("MetricAlarm", "CompositeAlarm"),
+    page_size: int = 100,
+    **describe_alarms_kwargs: Any,
+) -> Iterator[tuple[str, dict]]:
+    """
+    Lazily iterate over the CloudWatch Alarms for the account and region,
+    yielding each alarm as its page is retrieved
+
+    Args:
+        client (BaseClient): A Boto3 CloudWatch client
+        alarm_types (tuple[str, ...], optional): The alarm types to retrieve.
+                                                 Defaults to both
+                                                 MetricAlarm and
+                                                 CompositeAlarm.
+        page_size (int, optional): Alarms requested per describe_alarms
+                                   call, at most 100. Defaults to 100.
+        **describe_alarms_kwargs: Further describe_alarms filters, such as
+                                  AlarmNamePrefix, StateValue or
+                                  ActionPrefix. They are applied by
+                                  CloudWatch, so other alarms are never
+                                  sent back.
+
+    Yields:
+        tuple[str, dict]: The alarm type (MetricAlarm or CompositeAlarm) and
+        the alarm dict object
+    """
+
+    paginator: Paginator = client.get_paginator("describe_alarms")
+
+    # 100 is the largest page describe_alarms allows, the default is 50.
+    # Without AlarmTypes only metric alarms are returned.
+    for page in paginator.paginate(
+        AlarmTypes=list(alarm_types),
+        PaginationConfig={"PageSize": page_size},
+        **describe_alarms_kwargs,
+    ):
+        metric_alarms = page.get("MetricAlarms", [])
+        composite_alarms = page.get("CompositeAlarms", [])
+        logging.debug(
+            "Page with %s metric and %s composite alarms",
+            len(metric_alarms),
+            len(composite_alarms),
+        )
+        for alarm in metric_alarms:
+            yield "MetricAlarm", alarm
+        for alarm in composite_alarms:
+            yield "CompositeAlarm", alarm
 
 
 def retrieve_all_cw_alarms(
     client: BaseClient,
+    alarm_types: tuple[str, ...] = ("MetricAlarm", "CompositeAlarm"),
+    page_size: int = 100,
+    **describe_alarms_kwargs: Any,
 ) -> tuple[list[dict], list[dict]]:
-    paginator: Paginator = client.get_paginator("describe_alarms")
     """
     Retrieve the full list of CloudWatch Alarms for the account and region
 
     Args:
         client (BaseClient): A Boto3 CloudWatch client
+        alarm_types (tuple[str, ...], optional): The alarm types to retrieve.
+                                                 Defaults to both
+                                                 MetricAlarm and
+                                                 CompositeAlarm.
+        page_size (int, optional): Alarms requested per describe_alarms
+                                   call, at most 100. Defaults to 100.
+        **describe_alarms_kwargs: Passed on to iter_cw_alarms.
 
     Returns:
         tuple[list[dict], list[dict]]: A tuple containing two lists:
@@ -50,13 +287,12 @@ def retrieve_all_cw_alarms(
 
     metric_alarms_list: list[dict] = []
     composite_alarms_list: list[dict] = []
-    for page in paginator.paginate():
-        logging.info(f"Page:\n {page}")
-        for alarm in page["MetricAlarms"]:
-            logging.info(f"Metric Alarm retrieved: {alarm}")
+    for alarm_type, alarm in iter_cw_alarms(
+        client, alarm_types, page_size, **describe_alarms_kwargs
+    ):
+        if alarm_type == "MetricAlarm":
             metric_alarms_list.append(alarm)
-        for alarm in page.get("CompositeAlarms", []):
-            logging.info(f"Composite Alarm retrieved: {alarm}")
+        else:
             composite_alarms_list.append(alarm)
 
     logging.info(f"Total Metric Alarms: {len(metric_alarms_list)}")
@@ -65,86 +301,81 @@ def retrieve_all_cw_alarms(
     return metric_alarms_list, composite_alarms_list
 
 
-def alarm_has_description(alarm: dict[str, Any]) -> bool:
-    """
-    Checks if an alarm contains a non-empty decsription
-
-    Args:
-        alarm (dict[str, Any]): A CloudWatch alarm dict object
-
-    Returns:
-        bool: True if the alarm has a non-empty description, False otherwise
-    """
-    alarm_desc: Optional[str] = alarm.get("AlarmDescription")
-    if alarm_desc is None or alarm_desc.strip() == "":
-        return False
-
-    return True
-
-
-def alarm_has_actions(alarm: dict[str, Any]) -> bool:
+def retrieve_all_cw_alarms_multi_region(
+    regions: list[str],
+    alarm_types: tuple[str, ...] = ("MetricAlarm", "CompositeAlarm"),
+    page_size: int = 100,
+    **describe_alarms_kwargs: Any,
+) -> tuple[list[dict], list[dict]]:
     """
-    Checks if an alarm triggers any actions
+    Retrieve the full list of CloudWatch Alarms for the account across
+    several regions, listing each region concurrently
 
     Args:
-        alarm (dict[str, Any]): A CloudWatch alarm dict object
+        regions (list[str]): The regions to retrieve alarms from
+        alarm_types (tuple[str, ...], optional): The alarm types to retrieve.
+                                                 Defaults to both
+                                                 MetricAlarm and
+                                                 CompositeAlarm.
+        page_size (int, optional): Alarms requested per describe_alarms
+                                   call, at most 100. Defaults to 100.
+        **describe_alarms_kwargs: Passed on to iter_cw_alarms.
 
     Returns:
-        bool: True if the alarm triggers actions, False otherwise
-    """
-    return True if len(alarm["AlarmActions"]) > 0 else False
-
-
-def alarm_theshold_too_high(alarm: dict[str, Any]) -> bool:
+        tuple[list[dict], list[dict]]: A tuple containing two lists:
+            - The first list contains all Metric Alarms
+            - The second list contains all Composite Alarms
     """
-    Checks if the threshold for an alarm is too high (>30.0)
-
-    Args:
-        alarm (dict[str, Any]): A CloudWatch alarm dict object
+    # Clients are created here rather than in the workers, creating them
+    # from several threads at once is not thread safe
+    clients = [get_cw_client(region) for region in regions]
 
-    Returns:
-        bool: True if the threshold is above 30.0, False otherwise
-    """
-    alarm_threshold: Optional[float] = alarm.get("Threshold")
+    metric_alarms_list: list[dict] = []
+    composite_alarms_list: list[dict] = []
+    with ThreadPoolExecutor(max_workers=max(len(clients), 1)) as executor:
+        for metric_alarms, composite_alarms in executor.map(
+            lambda client: retrieve_all_cw_alarms(
+                client, alarm_types, page_size, **describe_alarms_kwargs
+            ),
+            clients,
+        ):
+            metric_alarms_list.extend(metric_alarms)
+            composite_alarms_list.extend(composite_alarms)
 
-    if not alarm_threshold or alarm_threshold > 30.0:
-        return True
-    return False
+    return metric_alarms_list, composite_alarms_list
 
 
-def alarm_data_points_too_high(alarm: dict[str, Any]) -> bool:
+def alarm_region(alarm: dict) -> str:
     """
-    Checks if the number of data points for an alarm is too high (>15)
+    Gets the region of an alarm from its ARN
 
     Args:
-        alarm (dict[str, Any]): A CloudWatch alarm dict object
+        alarm (dict): A CloudWatch alarm dict object
 
     Returns:
-        bool: True if the number of data points is above 15, False otherwise
+        str: The region the alarm is in
     """
-    alarm_data_points: Optional[int] = alarm.get("DatapointsToAlarm")
-
-    if not alarm_data_points or alarm_data_points > 15:
-        return True
-    return False
+    # arn:partition:cloudwatch:region:account-id:alarm:alarm-name
+    return alarm["AlarmArn"].split(":")[3]
 
 
 def basic_alarm_checks(
-    alarm_list: list[dict],
+    alarm_list: Iterable[dict],
 ) -> dict:
     """
     Performs basic checks on a list of CloudWatch alarms
 
     Args:
-        alarm_list (list[dict]): A list of CloudWatch alarm dict objects
+        alarm_list (Iterable[dict]): CloudWatch alarm dict objects, either as
+                                     a list or streamed from a generator
 
     Returns:
-        tuple[list[dict], list[dict], list[dict], list[dict]]: A tuple
-        containing four lists of alarm dictionaries:
-            1. Alarms without description
-            2. Alarms with too high threshold
-            3. Alarms with too high data points
-            4. Alarms without actions
+        dict: A dictionary containing four lists of alarm dictionaries:
+            - no_description: Alarms without description, or a blank one
+            - high_threshold: Alarms with a threshold above 30.0 or none
+            - high_data_points: Alarms alarming on more than 15 data points,
+              or with no DatapointsToAlarm set
+            - no_actions: Alarms without actions
     """
 
     alarms_without_description: list[dict] = []
@@ -152,15 +383,26 @@ def basic_alarm_checks(
     alarms_with_too_high_data_points: list[dict] = []
     alarms_without_actions: list[dict] = []
 
+    # The checks are written inline and the appends bound to locals as this
+    # loop runs once for every alarm in the account
+    no_description_append = alarms_without_description.append
+    high_threshold_append = alarms_with_too_high_threshold.append
+    high_data_points_append = alarms_with_too_high_data_points.append
+    no_actions_append = alarms_without_actions.append
+
     for alarm in alarm_list:
-        if not alarm_has_description(alarm):
-            alarms_without_description.append(alarm)
-        if alarm_theshold_too_high(alarm):
-            alarms_with_too_high_threshold.append(alarm)
-        if alarm_data_points_too_high(alarm):
-            alarms_with_too_high_data_points.append(alarm)
-        if not alarm_has_actions(alarm):
-            alarms_without_actions.append(alarm)
+        alarm_get = alarm.get
+        alarm_desc = alarm_get("AlarmDescription")
+        if not alarm_desc or not alarm_desc.strip():
+            no_description_append(alarm)
+        alarm_threshold = alarm_get("Threshold")
+        if alarm_threshold is None or alarm_threshold > 30.0:
+            high_threshold_append(alarm)
+        alarm_data_points = alarm_get("DatapointsToAlarm")
+        if alarm_data_points is None or alarm_data_points > 15:
+            high_data_points_append(alarm)
+        if not alarm_get("AlarmActions"):
+            no_actions_append(alarm)
     return {
         "no_description": alarms_without_description,
         "high_threshold": alarms_with_too_high_threshold,
@@ -171,18 +413,61 @@ def basic_alarm_checks(
 
 def get_alarm_history(client: BaseClient, alarm: dict) -> list[dict]:
     """
-    Gets the history of an alarm
+    Gets the state change history of an alarm
 
     Args:
         client (BaseClient): A Boto3 CloudWatch client
+        alarm (dict): A CloudWatch alarm dict object
 
     Returns:
-        tuple[list[dict], list[dict]]: A tuple containing two lists:
-            - The first list contains all Metric Alarms
-            - The second list contains all Composite Alarms
+        list[dict]: The StateUpdate history items of the alarm, newest first
     """
-    response = cw_client.describe_alarm_history(AlarmName=alarm["AlarmName"])
-    return response["AlarmHistoryItems"]
+    paginator: Paginator = client.get_paginator("describe_alarm_history")
+
+    # Only state changes are evaluated, so let CloudWatch drop configuration
+    # and action items before they are sent back. 100 is the largest page
+    # describe_alarm_history allows.
+    alarm_history: list[dict] = []
+    for page in paginator.paginate(
+        AlarmName=alarm["AlarmName"],
+        HistoryItemType="StateUpdate",
+        PaginationConfig={"PageSize": 100},
+    ):
+        alarm_history.extend(page.get("AlarmHistoryItems", []))
+
+    return alarm_history
+
+
+def get_all_alarm_histories(
+    alarms: list[dict], max_workers: int = 16
+) -> list[list[dict]]:
+    """
+    Gets the history of several alarms concurrently, each from the
+    CloudWatch client for the region in its ARN. Boto3 clients are thread
+    safe so each region's client is shared between the workers.
+
+    Args:
+        alarms (list[dict]): A list of CloudWatch alarm dict objects
+        max_workers (int, optional): Maximum number of concurrent requests.
+                                     Defaults to 16.
+
+    Returns:
+        list[list[dict]]: The history items of each alarm, in the same order
+        as the alarms list
+    """
+    # Create every region's client before the workers need them
+    for region in {alarm_region(alarm) for alarm in alarms}:
+        get_cw_client(region)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda alarm: get_alarm_history(
+                    get_cw_client(alarm_region(alarm)), alarm
+                ),
+                alarms,
+            )
+        )
 
 
 def get_alarm_start_time(
@@ -205,12 +490,47 @@ def get_alarm_start_time(
         raise ValueError("state_type must be either 'newState' or 'oldState'")
 
     alarm_hist = json.loads(alarm["HistoryData"])
+
+    return parse_state_start_time(alarm_hist, state_type)
+
+
+def get_alarm_start_times(alarm: dict) -> tuple[datetime, datetime]:
+    """
+    Takes an alarm history item and returns the Start times of both the old
+    and new state, parsing the HistoryData only once
+
+    Args:
+        alarm (dict[str, Any]): A CloudWatch alarm history item
+
+    Returns:
+        tuple[datetime, datetime]: The start time of the old state and the
+        start time of the new state
+    """
+    alarm_hist = json.loads(alarm["HistoryData"])
+
+    return (
+        parse_state_start_time(alarm_hist, "oldState"),
+        parse_state_start_time(alarm_hist, "newState"),
+    )
+
+
+def parse_state_start_time(alarm_hist: dict, state_type: str) -> datetime:
+    """
+    Takes parsed alarm HistoryData and returns the Start time of a state
+
+    Args:
+        alarm_hist (dict): The parsed HistoryData of an alarm history item
+        state_type (str): The state type to retrieve, newState or oldState
+
+    Returns:
+        datetime: The start time of the state
+    """
     alarm_start_time_string = alarm_hist[state_type]["stateReasonData"][
         "startDate"
     ]
-    last_alarm_start_time = datetime.strptime(
-        alarm_start_time_string, "%Y-%m-%dT%H:%M:%S.%f%z"
-    )
+    # CloudWatch dates are ISO 8601 (e.g. 2024-01-01T00:00:00.000+0000),
+    # which fromisoformat parses in C far faster than strptime
+    last_alarm_start_time = datetime.fromisoformat(alarm_start_time_string)
 
     return last_alarm_start_time
 
@@ -221,10 +541,13 @@ def check_alarm_history(alarm_history: list) -> dict:
     criteria
 
     Args:
-        alarm (dict): A CloudWatch alarm dict object
+        alarm_history (list): The StateUpdate history items of an alarm, as
+                              returned by get_alarm_history. Any other item
+                              types do not match a state change and are
+                              ignored.
 
     Returns:
-        dict: The full response from Amazon Bedrock
+        dict: The number of times the alarm met each history criteria
     """
 
     long_lived_alarm_count = 0
@@ -233,39 +556,31 @@ def check_alarm_history(alarm_history: list) -> dict:
     short_alarm_count = 0
     try:
         for alarm in reversed(alarm_history):
-            if alarm["HistoryItemType"] != "StateUpdate":
-                logging.info("Non Status Update data")
-                continue
-
-            if alarm["HistorySummary"] == "Alarm updated from OK to ALARM":
-                alarm_start_time = get_alarm_start_time(
-                    alarm, state_type="newState"
-                )
-                prev_alarm_close_time = get_alarm_start_time(
-                    alarm, state_type="oldState"
+            summary = alarm["HistorySummary"]
+            if summary == "Alarm updated from OK to ALARM":
+                prev_alarm_close_time, alarm_start_time = (
+                    get_alarm_start_times(alarm)
                 )
                 time_between_close_and_trigger = (
                     alarm_start_time - prev_alarm_close_time
                 )
-                if time_between_close_and_trigger <= timedelta(hours=24):
+                if time_between_close_and_trigger <= RECURRING_ALARM_WINDOW:
                     long_term_issue_count += 1
 
-                if time_between_close_and_trigger <= timedelta(hours=12):
+                if (
+                    time_between_close_and_trigger
+                    <= RECURRING_IN_12_HOURS_WINDOW
+                ):
                     recurring_in_12_hours_count += 1
 
-            elif alarm["HistorySummary"] == "Alarm updated from ALARM to OK":
-                alarm_close_time = get_alarm_start_time(
-                    alarm, state_type="newState"
-                )
-                alarm_start_time = get_alarm_start_time(
-                    alarm, state_type="oldState"
+            elif summary == "Alarm updated from ALARM to OK":
+                alarm_start_time, alarm_close_time = get_alarm_start_times(
+                    alarm
                 )
                 time_to_solve = alarm_close_time - alarm_start_time
-                if time_to_solve >= timedelta(hours=48):
+                if time_to_solve >= LONG_LIVED_ALARM_DURATION:
                     long_lived_alarm_count += 1
-                elif time_to_solve <= timedelta(
-                    minutes=2
-                ) and time_to_solve > timedelta(seconds=0):
+                elif ZERO_DURATION < time_to_solve <= SHORT_ALARM_DURATION:
                     short_alarm_count += 1
     except KeyError as ke:
         logging.error(ke)
@@ -277,14 +592,16 @@ def check_alarm_history(alarm_history: list) -> dict:
     }
 
 
-def generate_message(bedrock_runtime, model_id, system_prompt, messages):
+def generate_message(
+    bedrock_runtime, model_id, system_prompt, messages, max_tokens=2000
+):
     body = json.dumps(
         {
             "anthropic_version": "bedrock-2023-05-31",
             "system": system_prompt,
             "messages": messages,
             "temperature": 0.1,
-            "max_tokens": 2000,
+            "max_tokens": max_tokens,
         }
     )
 
@@ -296,15 +613,18 @@ def generate_message(bedrock_runtime, model_id, system_prompt, messages):
 
 def verify_llm_response(
     llm_response: dict, prefill: Optional[str] = None
-) -> dict:
+) -> Union[dict, list]:
     """
     Verifies the output of an LLM to determine if it is valid JSON
 
     Args:
-        llm_output (str): The output of the LLM
+        llm_response (dict): The full response from Amazon Bedrock
+        prefill (str, optional): String the LLM response was prefilled with.
+                                 Defaults to None.
 
     Returns:
-        bool: True if the output is valid, False otherwise
+        Union[dict, list]: The parsed JSON output, an empty dict if the output
+        is not valid JSON
     """
 
     llm_text = llm_response["content"][0]["text"]
@@ -315,12 +635,51 @@ def verify_llm_response(
     try:
         llm_json = json.loads(llm_text)
     except json.JSONDecodeError as e:
-        logging.error(f"Error parsing LLM output:\n{llm_json}\n{e}")
+        logging.error(f"Error parsing LLM output:\n{llm_text}\n{e}")
         return {}
 
     return llm_json
 
 
+def description_prompt_config(alarm: dict) -> str:
+    """
+    Serializes the fields of an alarm that are sent to Bedrock with its
+    description. Both prompts and the description hash use this, so the
+    cache key always matches what the model was shown.
+
+    Args:
+        alarm (dict): A CloudWatch alarm dict object
+    Returns:
+        str: JSON object of the alarm's DESCRIPTION_PROMPT_FIELDS
+    """
+    alarm_summary = {
+        k: alarm[k] for k in DESCRIPTION_PROMPT_FIELDS if k in alarm
+    }
+    return json.dumps(alarm_summary, default=str)
+
+
+def build_messages(u_msg: str, prefill: Optional[str] = None) -> list[dict]:
+    """
+    Builds the messages of a Bedrock request from the user message and an
+    optional assistant prefill
+
+    Args:
+        u_msg (str): The user message
+        prefill (str, optional): String to prefill the LLM response with.
+                                 Defaults to None.
+    Returns:
+        list[dict]: The messages to send to Bedrock
+    """
+    user_message = {"role": "user", "content": u_msg}
+    messages = [user_message]
+
+    if prefill:
+        prefill_msg = {"role": "assistant", "content": prefill}
+        messages.append(prefill_msg)
+
+    return messages
+
+
 def check_alarm_description(
     alarm: dict, prefill: Optional[str] = None
 ) -> dict:
@@ -334,64 +693,353 @@ def check_alarm_description(
         dict: The full response from Amazon Bedrock
     """
 
-    bedrock_runtime = boto3.client(
-        service_name="bedrock-runtime", region_name=AWS_BEDROCK_REGION
+    u_msg = (
+        f"Evaluate if the description is meaningful and representative"
+        f"of the alarm then sugggest a new alarm if necessary.\n\n"
+        f"<desc>{alarm.get("AlarmDescription")}</desc>\n\n"
+        f"<alarm>{description_prompt_config(alarm)}</alarm>\n\n"
     )
+    messages = build_messages(u_msg, prefill)
 
-    model_id = "anthropic.claude-3-sonnet-20240229-v1:0"
-    # This model is better but we are rate limited internally
-    # model_id = "anthropic.claude-3-5-sonnet-20241022-v2:0"
-    # model_id = "anthropic.claude-3-5-haiku-20241022-v1:0"
-    system_prompt = """
-    You are a helpful assistant that analyzes CloudWatch Alarm data.
-    You assess whether alarm descriptions are meaningful and representative of
-    the alarm.
-    You will be presented an Alarm description (in <desc>) tags
-    and a JSON object that describes the alarm (in <alarm> tags).
-    If the alarm description is not in the object, is None or is a blank
-    string, suggest a new description
-    Alarm descriptions should be descriptive, containing information on what
-    metric triggers the alarm as well as the threshold and
-    what actions are triggered.
-    Additionally, it is good practice to link a playbook (only 1 link should
-    be included).
+    response = generate_message(
+        get_bedrock_runtime(), MODEL_ID, DESCRIPTION_SYSTEM_PROMPT, messages
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logging.debug(json.dumps(response, indent=2))
 
-    After assessing the alarm, provide a suggested new alarm
-    description that incorporates your feedback.
+    return response
 
-    When returning your output, be succinct in your assessment,
-    skip any preamble and wrap it into a JSON object like the following:
-    {
-        "assessment": <your assessment>,
-        "suggested_description": <your suggested description>
-    }
+
+def check_alarm_descriptions(
+    alarms: list[dict], prefill: Optional[str] = None
+) -> dict:
+    """
+    Checks the descriptions of several alarms in a single request and
+    suggests improvements. Each alarm is identified by its position in the
+    list.
+    Args:
+        alarms (list[dict]): A list of CloudWatch alarm dict objects
+        prefill (str, optional): String to prefill the LLM response with.
+                                 Defaults to None.
+    Returns:
+        dict: The full response from Amazon Bedrock
     """
 
     u_msg = (
-        f"Evaluate if the description is meaningful and representative"
-        f"of the alarm then sugggest a new alarm if necessary.\n\n"
-        f"<desc>{alarm.get("AlarmDescription")}</desc>\n\n"
-        f"<alarm>{json.dumps(alarm, default=str)}</alarm>\n\n"
+        "Evaluate if each description is meaningful and representative "
+        "of its alarm then sugggest a new description if necessary.\n\n"
     )
+    for alarm_id, alarm in enumerate(alarms):
+        u_msg += (
+            f"<alarm id=\"{alarm_id}\">"
+            f"<desc>{alarm.get("AlarmDescription")}</desc>"
+            f"<config>{description_prompt_config(alarm)}</config>"
+            f"</alarm>\n\n"
+        )
+    messages = build_messages(u_msg, prefill)
 
-    user_message = {"role": "user", "content": u_msg}
-    messages = [user_message]
-
-    if prefill:
-        prefill_msg = {"role": "assistant", "content": prefill}
-        messages.append(prefill_msg)
-
+    # Every alarm adds its own assessment to the output, so allow for the
+    # largest response the model supports
     response = generate_message(
-        bedrock_runtime, model_id, system_prompt, messages
+        get_bedrock_runtime(),
+        MODEL_ID,
+        DESCRIPTION_BATCH_SYSTEM_PROMPT,
+        messages,
+        max_tokens=4096,
     )
-    logging.info(json.dumps(response, indent=2))
+    if logger.isEnabledFor(logging.DEBUG):
+        logging.debug(json.dumps(response, indent=2))
 
     return response
 
 
+def suggest_alarm_description(
+    alarm: dict, prefill: Optional[str] = None
+) -> dict:
+    """
+    Asks the LLM to assess the description of an alarm and parses the
+    suggested improvements
+
+    Args:
+        alarm (dict): A CloudWatch alarm dict object
+        prefill (str, optional): String to prefill the LLM response with.
+                                 Defaults to None.
+    Returns:
+        dict: The parsed LLM output, empty if it was not valid JSON
+    """
+    alarm_description_check: dict = check_alarm_description(alarm, prefill)
+
+    return verify_llm_response(alarm_description_check, prefill)
+
+
+def suggest_alarm_description_batch(alarms: list[dict]) -> list[dict]:
+    """
+    Asks the LLM to assess the descriptions of several alarms in one request
+    and parses the suggested improvements
+
+    Args:
+        alarms (list[dict]): A list of CloudWatch alarm dict objects
+    Returns:
+        list[dict]: The parsed LLM output of each alarm, in the same order
+        as the alarms list. Alarms missing from the output get an empty dict.
+    """
+    # Prefilling the array keeps the model from adding a preamble
+    prefill = "["
+    alarm_description_check: dict = check_alarm_descriptions(alarms, prefill)
+    llm_json = verify_llm_response(alarm_description_check, prefill)
+
+    suggestions: dict = {}
+    if isinstance(llm_json, list):
+        for suggestion in llm_json:
+            if isinstance(suggestion, dict):
+                suggestions[str(suggestion.get("id"))] = suggestion
+
+    return [
+        suggestions.get(str(alarm_id), {}) for alarm_id in range(len(alarms))
+    ]
+
+
+def suggest_alarm_descriptions(
+    alarms: list[dict],
+    prefill: Optional[str] = None,
+    max_workers: int = 8,
+    batch_size: int = 1,
+) -> list[dict]:
+    """
+    Suggests descriptions for several alarms concurrently. Bedrock calls
+    share the client cached by get_bedrock_runtime, which is thread safe.
+
+    Args:
+        alarms (list[dict]): A list of CloudWatch alarm dict objects
+        prefill (str, optional): String to prefill the LLM response with when
+                                 alarms are sent one at a time.
+                                 Defaults to None.
+        max_workers (int, optional): Maximum number of concurrent Bedrock
+                                     requests. Defaults to 8.
+        batch_size (int, optional): Number of alarms assessed per Bedrock
+                                    request, at most
+                                    MAX_DESCRIPTION_BATCH_SIZE.
+                                    Defaults to 1.
+    Returns:
+        list[dict]: The parsed LLM output of each alarm, in the same order
+        as the alarms list
+    """
+    batch_size = min(batch_size, MAX_DESCRIPTION_BATCH_SIZE)
+
+    # Create the client before the threads do, boto3 sessions are not safe
+    # to create clients from concurrently
+    get_bedrock_runtime()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if batch_size <= 1:
+            return list(
+                executor.map(
+                    lambda alarm: suggest_alarm_description(alarm, prefill),
+                    alarms,
+                )
+            )
+
+        batches = [
+            alarms[i : i + batch_size]
+            for i in range(0, len(alarms), batch_size)
+        ]
+        return [
+            suggestion
+            for batch_suggestions in executor.map(
+                suggest_alarm_description_batch, batches
+            )
+            for suggestion in batch_suggestions
+        ]
+
+
+def description_hash(alarm: dict, batched: bool = False) -> str:
+    """
+    Hashes everything that goes into the description prompt of an alarm, so
+    that an unchanged hash means an unchanged assessment
+
+    Args:
+        alarm (dict): A CloudWatch alarm dict object
+        batched (bool, optional): Whether the alarm is assessed in a batched
+                                  prompt. Defaults to False.
+    Returns:
+        str: Hex digest of the model, system prompt and the alarm's prompt
+        fields
+    """
+    if batched:
+        system_prompt = DESCRIPTION_BATCH_SYSTEM_PROMPT
+    else:
+        system_prompt = DESCRIPTION_SYSTEM_PROMPT
+    content = json.dumps(
+        {
+            "model": MODEL_ID,
+            "system": system_prompt,
+            "batched": batched,
+            "alarm": description_prompt_config(alarm),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def get_cached_descriptions(alarm_arns: list[str]) -> dict:
+    """
+    Retrieves the stored description assessments of alarms from the
+    description table
+
+    Args:
+        alarm_arns (list[str]): The ARNs of the alarms to look up
+    Returns:
+        dict: The stored items by alarm ARN. Alarms without an item are left
+        out, as are alarms whose lookup failed.
+    """
+    cached: dict = {}
+    try:
+        # batch_get_item accepts at most 100 keys per request
+        for i in range(0, len(alarm_arns), 100):
+            request_items = {
+                DESCRIPTION_TABLE_NAME: {
+                    "Keys": [{"id": arn} for arn in alarm_arns[i : i + 100]],
+                    "ProjectionExpression": "id, DescriptionHash, "
+                    "DescriptionAssessment, SuggestedDescription",
+                }
+            }
+            # Unprocessed keys come back in a successful response, so the
+            # client's retries do not cover them. Back off before resending.
+            for attempt in range(CACHE_READ_ATTEMPTS):
+                if attempt:
+                    time.sleep(0.1 * 2**attempt)
+                response = get_dynamodb().batch_get_item(
+                    RequestItems=request_items
+                )
+                for item in response["Responses"].get(
+                    DESCRIPTION_TABLE_NAME, []
+                ):
+                    cached[item["id"]] = item
+                request_items = response.get("UnprocessedKeys")
+                if not request_items:
+                    break
+            else:
+                logger.warning(
+                    "Cached descriptions still unprocessed after %s attempts, "
+                    "the remaining alarms will be assessed again",
+                    CACHE_READ_ATTEMPTS,
+                )
+                return cached
+    except Exception as e:
+        # A missing cache only costs Bedrock calls, it is not worth failing
+        # the run over. Whatever was read before the error is still valid.
+        logger.warning("Could not read cached descriptions: %s", e)
+
+    return cached
+
+
+def carry_forward_descriptions(alarm_map: dict, alarm_arns: list[str]):
+    """
+    Copies the stored description assessment of alarms that are not assessed
+    this run into the alarm map. Writing the map replaces whole items, which
+    would otherwise erase them.
+
+    Args:
+        alarm_map (dict): A dictionary containing the alarms and check results
+        alarm_arns (list[str]): The ARNs of the alarms that are not assessed
+    """
+    for alarm_arn, item in get_cached_descriptions(alarm_arns).items():
+        for k in (
+            "DescriptionAssessment",
+            "SuggestedDescription",
+            "DescriptionHash",
+        ):
+            if k in item:
+                alarm_map[alarm_arn][k] = item[k]
+
+
+def suggest_alarm_descriptions_cached(
+    alarms: list[dict],
+    prefill: Optional[str] = None,
+    max_workers: int = 8,
+    batch_size: int = 1,
+) -> tuple[list[dict], list[str]]:
+    """
+    Suggests descriptions for several alarms, reusing the stored assessment
+    of any alarm whose description hash matches the one stored with it.
+    Only the remaining alarms are sent to Bedrock.
+
+    Args:
+        alarms (list[dict]): A list of CloudWatch alarm dict objects
+        prefill (str, optional): String to prefill the LLM response with when
+                                 alarms are sent one at a time.
+                                 Defaults to None.
+        max_workers (int, optional): Maximum number of concurrent Bedrock
+                                     requests. Defaults to 8.
+        batch_size (int, optional): Number of alarms assessed per Bedrock
+                                    request. Defaults to 1.
+    Returns:
+        tuple[list[dict], list[str]]: The parsed LLM output and the
+        description hash of each alarm, in the same order as the alarms list
+    """
+    batched = batch_size > 1
+    hashes = [description_hash(alarm, batched) for alarm in alarms]
+    cached = get_cached_descriptions([alarm["AlarmArn"] for alarm in alarms])
+
+    suggestions: list = [None] * len(alarms)
+    misses: list = []
+    for i, (alarm, alarm_hash) in enumerate(zip(alarms, hashes)):
+        item = cached.get(alarm["AlarmArn"])
+        if (
+            item
+            and item.get("DescriptionHash") == alarm_hash
+            and item.get("DescriptionAssessment") is not None
+        ):
+            suggestions[i] = {
+                "assessment": item["DescriptionAssessment"],
+                "suggested_description": item.get("SuggestedDescription"),
+            }
+        else:
+            misses.append(i)
+
+    logging.info(
+        "Reusing %s cached description assessments, requesting %s",
+        len(alarms) - len(misses),
+        len(misses),
+    )
+    # Without misses there is nothing to ask, and no Bedrock client to create
+    if misses:
+        fresh = suggest_alarm_descriptions(
+            [alarms[i] for i in misses], prefill, max_workers, batch_size
+        )
+        for i, suggestion in zip(misses, fresh):
+            suggestions[i] = suggestion
+
+    return suggestions, hashes
+
+
+def to_dynamo_type(value: Any) -> Any:
+    """
+    Converts a value, and any values nested within it, to a valid Dynamo type
+
+    Args:
+        value (Any): A value from an alarm dict
+
+    Returns:
+        Any: The value with datetimes as strings and floats as Decimals
+    """
+    # botocore only ever returns these exact types, so a type() identity
+    # check is enough and cheaper than isinstance
+    value_type = type(value)
+    if value_type is float:
+        return Decimal(str(value))
+    if value_type is datetime:
+        return value.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+    if value_type is dict:
+        return {k: to_dynamo_type(v) for k, v in value.items()}
+    if value_type is list:
+        return [to_dynamo_type(v) for v in value]
+    return value
+
+
 def convert_invalid_types(alarm: dict) -> dict:
     """
-    Converts invalid types in a dict to valid Dynamo types
+    Converts invalid types in a dict to valid Dynamo types, including those
+    in nested dicts and lists such as Metrics
 
     Args:
         dict: A dict object of alarm details
@@ -400,13 +1048,9 @@ def convert_invalid_types(alarm: dict) -> dict:
         dict: The alarm dict with Dynamo compatible types
     """
 
-    logging.info(f"Converting invalid types: {alarm.get("AlarmName")}")
+    logging.debug("Converting invalid types: %s", alarm.get("AlarmName"))
     for k, v in alarm.items():
-        logging.info(f"{k}:{v}")
-        if isinstance(v, datetime):
-            alarm[k] = v.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
-        elif isinstance(v, float):
-            alarm[k] = Decimal(str(v))
+        alarm[k] = to_dynamo_type(v)
 
     return alarm
 
@@ -424,23 +1068,35 @@ def write_basic_alarm_checks_to_dynamo(alarms_dict: dict) -> dict:
 
     logging.info(f"Writing basic alarm checks to {TABLE_NAME} in {AWS_REGION}")
     try:
-        for key, value in alarms_dict.items():
-            for alarm in value:
-                alarm = convert_invalid_types(alarm)
-            item = {"id": key, "alarm_list": value}
-            basic_alarm_table.put_item(Item=item)
-
-            logging.info(f"Successfully wrote {key} to DynamoDB table")
-            logging.info(f"Item: {json.dumps(item, default=str)}")
+        # batch_writer buffers puts into BatchWriteItem calls of up to 25
+        # items and resends any unprocessed items on our behalf
+        with get_basic_alarm_table().batch_writer(
+            overwrite_by_pkeys=["id"]
+        ) as bw:
+            for key, value in alarms_dict.items():
+                # Only keep what the report needs, a list of full alarm
+                # copies can exceed the 400 KB DynamoDB item size limit
+                alarm_list = [
+                    {k: alarm.get(k) for k in REPORT_ALARM_FIELDS}
+                    for alarm in value
+                ]
+                item = {"id": key, "alarm_list": alarm_list}
+                bw.put_item(Item=item)
+
+                logging.debug("Queued %s: %s", key, item)
+
+        # put_item only buffers, items are written when the writer flushes
+        logging.info(
+            "Successfully wrote %s items to %s", len(alarms_dict), TABLE_NAME
+        )
 
         return {
             "statusCode": 200,
             "body": json.dumps(
                 {
-                    "message": "Successfully wrote timestamp to DynamoDB",
-                    "item": item,
-                },
-                default=str,
+                    "message": "Successfully wrote alarm checks to DynamoDB",
+                    "written": list(alarms_dict.keys()),
+                }
             ),
         }
 
@@ -468,25 +1124,33 @@ def write_alarm_description_to_dynamo(alarm_map: dict):
         """
     )
     try:
-        for alarm_id, alarm_attributes in alarm_map.items():
-            item = {"id": alarm_id}
-            convert_invalid_types(alarm_attributes)
-            for k, v in alarm_attributes.items():
-                item[k] = v
-            logging.info(f"\n\nItem: {json.dumps(item, default=str)}")
-            alarm_description_table.put_item(Item=item)
-
-            logging.info(f"Successfully wrote {alarm_id} to DynamoDB table")
-            logging.info(f"Item: {json.dumps(item, default=str)}")
+        with get_alarm_description_table().batch_writer(
+            overwrite_by_pkeys=["id"]
+        ) as bw:
+            for alarm_id, alarm_attributes in alarm_map.items():
+                item = {"id": alarm_id}
+                convert_invalid_types(alarm_attributes)
+                for k, v in alarm_attributes.items():
+                    item[k] = v
+                bw.put_item(Item=item)
+
+                logging.debug("Queued %s: %s", alarm_id, item)
+
+        # put_item only buffers, items are written when the writer flushes
+        logging.info(
+            "Successfully wrote %s items to %s",
+            len(alarm_map),
+            DESCRIPTION_TABLE_NAME,
+        )
 
         return {
             "statusCode": 200,
             "body": json.dumps(
                 {
-                    "message": "Successfully wrote timestamp to DynamoDB",
-                    "item": item,
-                },
-                default=str,
+                    "message": "Successfully wrote alarm descriptions to "
+                    "DynamoDB",
+                    "written": len(alarm_map),
+                }
             ),
         }
 
@@ -496,7 +1160,7 @@ def write_alarm_description_to_dynamo(alarm_map: dict):
         return {"statusCode": 500, "body": json.dumps({"error": error_msg})}
 
 
-def create_alarm_map(alarms_list: list[dict]) -> dict:
+def create_alarm_map(alarms_list: Iterable[dict]) -> dict:
     """
     Function that takes a list of CW Alarms and
     produces a dictionary of those alarms where the key is
@@ -504,7 +1168,8 @@ def create_alarm_map(alarms_list: list[dict]) -> dict:
     corresponding to checks carried out.
 
     Args:
-        alarms_list (list[dict]): A list of CW Alarms
+        alarms_list (Iterable[dict]): CW Alarms, either as a list or
+                                      streamed from a generator
     Returns:
         dict: A dictionary of CW Alarms with Arn as the key
 
@@ -552,8 +1217,21 @@ def create_alarm_with_flags(
 
 
 if __name__ == "__main__":
-    metrics_alarm_list, composit_alarms_list = retrieve_all_cw_alarms(
-        cw_client
+    # Configured here rather than on import so that importing the module
+    # does not add a second handler to an already configured root logger
+    logging.basicConfig(level=logging.INFO)
+
+    describe_alarms_kwargs: dict = {}
+    if ALARM_NAME_PREFIX:
+        describe_alarms_kwargs["AlarmNamePrefix"] = ALARM_NAME_PREFIX
+
+    metrics_alarm_list, composit_alarms_list = (
+        retrieve_all_cw_alarms_multi_region(
+            ALARM_REGIONS,
+            # Composite alarms are not analysed, so do not download them
+            alarm_types=("MetricAlarm",),
+            **describe_alarms_kwargs,
+        )
     )
 
     alarm_map: dict = create_alarm_map(metrics_alarm_list)
@@ -579,8 +1257,10 @@ if __name__ == "__main__":
 
     # Quotes need to be escaped here. Beware Ruff changes them.
     prefill = "{\"assessment\":"
-    for alarm in metrics_alarm_list:
-        alarm_hist = get_alarm_history(cw_client, alarm)
+    alarm_histories = get_all_alarm_histories(
+        metrics_alarm_list, max_workers=HISTORY_CONCURRENCY
+    )
+    for alarm, alarm_hist in zip(metrics_alarm_list, alarm_histories):
         alarm_check_dict = check_alarm_history(alarm_hist)
         for check_type, count in alarm_check_dict.items():
             if not basic_alarm_checks_dict.get(check_type):
@@ -588,20 +1268,51 @@ if __name__ == "__main__":
             if count > 2:
                 basic_alarm_checks_dict[check_type].append(alarm)
 
-        alarm_description_check: dict = check_alarm_description(alarm, prefill)
-        llm_json_output: dict = verify_llm_response(
-            alarm_description_check, prefill
+    if DESCRIBE_MISSING_ONLY:
+        description_alarm_list = basic_alarm_checks_dict["no_description"]
+        assessed_arns = {alarm["AlarmArn"] for alarm in description_alarm_list}
+        carry_forward_descriptions(
+            alarm_map,
+            [arn for arn in alarm_map if arn not in assessed_arns],
         )
-        logging.info(f"LLM Output: {llm_json_output}")
+    else:
+        description_alarm_list = metrics_alarm_list
+
+    if DESCRIPTION_CACHE:
+        llm_json_outputs, description_hashes = (
+            suggest_alarm_descriptions_cached(
+                description_alarm_list,
+                prefill,
+                max_workers=BEDROCK_CONCURRENCY,
+                batch_size=DESCRIPTION_BATCH_SIZE,
+            )
+        )
+    else:
+        llm_json_outputs = suggest_alarm_descriptions(
+            description_alarm_list,
+            prefill,
+            max_workers=BEDROCK_CONCURRENCY,
+            batch_size=DESCRIPTION_BATCH_SIZE,
+        )
+        description_hashes = [None] * len(description_alarm_list)
+    for alarm, llm_json_output, alarm_hash in zip(
+        description_alarm_list, llm_json_outputs, description_hashes
+    ):
+        logging.info("LLM Output: %s", llm_json_output)
         alarm_map[alarm["AlarmArn"]]["DescriptionAssessment"] = (
             llm_json_output.get("assessment")
         )
         alarm_map[alarm["AlarmArn"]]["SuggestedDescription"] = (
             llm_json_output.get("suggested_description")
         )
-        logging.info(
-            f"Alarm Map: {json.dumps(alarm_map[alarm["AlarmArn"]], indent=2)}"
-        )
+        # Failed assessments are stored without a hash so they are retried
+        if alarm_hash and llm_json_output.get("assessment") is not None:
+            alarm_map[alarm["AlarmArn"]]["DescriptionHash"] = alarm_hash
+        if logger.isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Alarm Map: %s",
+                json.dumps(alarm_map[alarm["AlarmArn"]], indent=2),
+            )
 
     write_basic_alarm_checks_to_dynamo(basic_alarm_checks_dict)
     dynamo_response = write_alarm_description_to_dynamo(alarm_map)